@@ -6,29 +6,76 @@ It is organized into three logical sections:
 1. **Configuration** – constants and helper functions.
 2. **Tool definitions** – native tools that the model can invoke.
 3. **Main execution** – orchestration of the client, tool discovery, and the
-   recursive chat loop.
+   tool-calling chat loop.
 
 **Note:** To run this project with Python 3, activate the virtual environment first:
 ```bash
 source .venv/bin/activate
 ```
+
+Tool calls of one turn run concurrently, at most ``TOOL_CONCURRENCY`` at a
+time (environment variable, default 8). Keep it in line with the server side
+limits, e.g. ``OLLAMA_NUM_PARALLEL`` for tools that call back into Ollama.
 """
 
 from __future__ import annotations
 
 import asyncio
+import inspect
+import json
+import os
 import signal
-from typing import Any, AsyncGenerator, Dict, List, Callable
+import sys
+import time
+from types import MappingProxyType
+from typing import Any, AsyncGenerator, Awaitable, Dict, List, Callable, Mapping, Tuple
 
+import httpx
 from ollama import AsyncClient, ChatResponse, Message, ShowResponse
+from ollama import Tool as OllamaTool
+try:
+    # Private helper (checked against ollama 0.6.1) that AsyncClient.chat
+    # itself uses to turn a function into a Tool
+    from ollama._utils import convert_function_to_tool
+except ImportError:
+    # Moved or gone: keep native tools as callables and let the client
+    # convert them on each request
+    convert_function_to_tool = None
 
 from fastmcp import Client as MpcClient
 from fastmcp.client.client import CallToolResult
-from mcp.types import ListToolsResult
+from fastmcp.client.transports import StreamableHttpTransport
+from mcp.types import ListToolsResult, TextContent, Tool
 
 LLM_PORT: int = 8080
 LLM_HOST: str = f"http://localhost:{LLM_PORT}"
+MCP_URL: str = "http://localhost:8081/mcp"
 DEFAULT_MODEL: str = "qwen3:4b"
+# Print the full tool call payloads received from the model
+DEBUG: bool = False
+# Maximum number of tool calls running at the same time
+TOOL_CONCURRENCY: int = int(os.getenv("TOOL_CONCURRENCY", "8"))
+# Rounds of tool calls allowed per user prompt before giving up, so that a
+# model stuck calling tools does not resend an ever growing history forever
+MAX_TOOL_DEPTH: int = 8
+# Keep connections to Ollama alive between chat/list/show calls so every
+# request does not pay a new TCP handshake.
+LLM_POOL_LIMITS: httpx.Limits = httpx.Limits(
+    max_connections=8,
+    max_keepalive_connections=8,
+    keepalive_expiry=60,
+)
+# Generation may take long, so only bound the time to connect to Ollama
+LLM_TIMEOUT: httpx.Timeout = httpx.Timeout(None, connect=10.0)
+# Concurrent tool calls each take a connection to the MCP server
+MCP_POOL_LIMITS: httpx.Limits = httpx.Limits(
+    max_connections=32,
+    max_keepalive_connections=32,
+    keepalive_expiry=60,
+)
+# Used when the transport passes no timeout: 30s per request, but leave the
+# streamed (SSE) responses up to 5 minutes between events
+MCP_TIMEOUT: httpx.Timeout = httpx.Timeout(30.0, read=300.0)
 
 class LlmConfig:
     def __init__(self, model):
@@ -38,6 +85,44 @@ class LlmConfig:
 
 DEFAULT_CONFIG: LlmConfig = LlmConfig(DEFAULT_MODEL)
 
+class StreamWriter:
+    """Buffer streamed tokens and write them to stdout in batches.
+
+    Flushing on every token costs a syscall per token; instead the text is
+    flushed once ``max_chars`` are pending or ``max_delay`` seconds passed
+    since the last flush, which keeps the output responsive.
+
+    When stdout is not a terminal nobody watches the tokens arrive, so the
+    time based flush is skipped and text is written in ``PIPE_MAX_CHARS``
+    blocks or when the caller flushes at the end of a message.
+    """
+    PIPE_MAX_CHARS: int = 65536
+
+    def __init__(self, max_chars: int = 64, max_delay: float = 0.05):
+        self.interactive = sys.stdout.isatty()
+        self.max_chars = max_chars if self.interactive else self.PIPE_MAX_CHARS
+        self.max_delay = max_delay
+        self._parts: List[str] = []
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self._write = sys.stdout.write
+
+    def write(self, text: str) -> None:
+        self._parts.append(text)
+        self._pending += len(text)
+        if (self._pending >= self.max_chars
+                or (self.interactive
+                    and time.monotonic() - self._last_flush > self.max_delay)):
+            self.flush()
+
+    def flush(self) -> None:
+        if self._parts:
+            self._write("".join(self._parts))
+            self._parts.clear()
+            self._pending = 0
+        sys.stdout.flush()
+        self._last_flush = time.monotonic()
+
 def hello_tool(model_name: str = "Llm Assistant") -> str:
     """Return a friendly greeting that includes the assistent model name, so that
     the user knows what is the model name
@@ -50,55 +135,81 @@ def hello_tool(model_name: str = "Llm Assistant") -> str:
     """
     return f"Hello from hello_tool by {model_name}"
 
+# Native tools exposed to the model, built once and shared read-only
+NATIVE_TOOLS: Mapping[str, Callable] = MappingProxyType({"hello_tool": hello_tool})
+
 
 def read_multiline() -> str:
     """Read user input until an empty line (two consecutive newlines) is entered.
 
             Returns the collected text as a single string, preserving internal newlines.
+            Raises ``EOFError`` when stdin is exhausted before any line is read.
     """
     lines: List[str] = []
+    readline = sys.stdin.readline
     while True:
-        line = input()
+        line = readline()
         if line == "":
+            # EOF: end the pending input, or report it if there is none
+            if not lines:
+                raise EOFError
+            break
+        # "\n" is the empty line terminating the input
+        if line == "\n":
             break
-        lines.append(line)
+        lines.append(line.rstrip("\n"))
     return "\n".join(lines)
 
 
-def mcp_tool_to_schema(tool: dict) -> dict:
+def mcp_tool_to_schema(tool: Tool) -> dict:
     """Convert an MCP tool description to the JSON schema expected by Ollama.
+
+    Reads the attributes of the pydantic ``Tool`` directly instead of dumping
+    the whole model to a dict first.
     """
 
-    parameters: dict = tool.get(
-        "inputSchema",
-        {"type": "object", "properties": {}, "required": []},
-    )
+    parameters: dict = tool.inputSchema or {
+        "type": "object", "properties": {}, "required": []
+    }
 
     return {
         "type": "function",
         "function": {
-            "name": tool["name"],
-            "description": tool.get("description", ""),
+            "name": tool.name,
+            "description": tool.description or "",
             "parameters": parameters,
         },
     }
 
+class ToolCallError(Exception):
+    """Raised by ``AgentContext.call_tool`` when a tool call fails."""
+
+
+def tool_call_key(fun_name: str, fun_args: Dict[str, Any]) -> Tuple[str, str]:
+    """Hashable identity of a tool call, used to spot repeated calls."""
+    return fun_name, json.dumps(fun_args, sort_keys=True, default=str)
+
+
 class AgentContext:
     def __init__(self,
                  llm_client: AsyncClient,
                  mcp_client: McpClient,
                  llm_config: LlmConfig = DEFAULT_CONFIG,
                  mcp_tools: Dict[str, dict] = {},
-                 native_tools: Dict[str, Callable] = {},
+                 native_tools: Mapping[str, Callable] = {},
                  messages: List[Dict[str, any]] = [],
                  ):
         self.llm_client: AsyncClient = llm_client
         self.mcp_client = mcp_client
         self.llm_config = llm_config
-        self.mcp_tools = mcp_tools
-        self.native_tools = native_tools
         self.messages = messages
+        self.set_tools(mcp_tools, native_tools)
         self.model_capabilities: List[str] = []
+        # Scratch buffer reused by every llm call to collect streamed tool calls
+        self.tool_call_buffer: List[Any] = []
+        # Bounds the concurrent tool calls so a large turn does not flood
+        # the MCP server
+        self._tool_semaphore = asyncio.Semaphore(TOOL_CONCURRENCY)
         # Track which configuration options are supported by the current model
         self.allowed_config: Dict[str, bool] = {
             "streaming": True,
@@ -142,22 +253,65 @@ class AgentContext:
             print(f"Failed to retrieve capabilities for model '{model_name}': {e}")
             self.model_capabilities = []
 
+    def set_tools(
+            self,
+            mcp_tools: Dict[str, dict],
+            native_tools: Mapping[str, Callable]
+    ) -> None:
+        """Replace the available tools and rebuild the cached tools payload.
+
+        The merged dict and its values list are computed once here instead of
+        on every llm round, so any change to the tools must go through this
+        method to keep the cache valid. The values are converted to ollama
+        ``Tool`` models up front, otherwise the client re-parses the native
+        tool docstrings and re-validates every schema dict on each request.
+        """
+        self.mcp_tools = mcp_tools
+        self.native_tools = native_tools
+        # (is_async, function) per native tool, resolved once for call_tool
+        self._native_dispatch: Dict[str, Tuple[bool, Callable]] = {
+            name: (inspect.iscoroutinefunction(fun), fun)
+            for name, fun in native_tools.items()
+        }
+        self._all_tools = {**native_tools, **mcp_tools}
+        self._tools_values = tuple(
+            (t if convert_function_to_tool is None else convert_function_to_tool(t))
+            if callable(t) else OllamaTool.model_validate(t)
+            for t in self._all_tools.values()
+        )
+
     def get_all_tools(self):
-        return {**self.native_tools, **self.mcp_tools}
+        return self._all_tools
+
+    def get_tools_values(self) -> Tuple[OllamaTool | Callable, ...]:
+        return self._tools_values
 
     async def call_tool(self, fun_name: str, fun_args):
-        if fun_name in self.native_tools:
-            return self.native_tools[fun_name](**fun_args)
+        async with self._tool_semaphore:
+            return await self._call_tool(fun_name, fun_args)
+
+    async def _call_tool(self, fun_name: str, fun_args):
+        native = self._native_dispatch.get(fun_name)
+        if native is not None:
+            is_async, fun = native
+            return await fun(**fun_args) if is_async else fun(**fun_args)
         elif fun_name in self.mcp_tools:
             # Forward the call to the MCP server.
             tool_res: CallToolResult = await self.mcp_client.call_tool_mcp(
                 fun_name, fun_args)
             if tool_res.isError:
-                return f"Tool call {fun_name} failed"
-            else:
-                return tool_res.structuredContent.get("result", "")
+                raise ToolCallError(f"Tool call {fun_name} failed")
+            structured = tool_res.structuredContent
+            if structured is not None:
+                result = structured.get("result", "")
+                # Tools returning lists/objects come back decoded; the model
+                # only takes text
+                return result if isinstance(result, str) else json.dumps(result)
+            # Tools without an output schema only return content blocks
+            return "".join(
+                c.text for c in tool_res.content if isinstance(c, TextContent))
         else:
-            return f"Unknown tool: {fn_name}"
+            raise ToolCallError(f"Unknown tool: {fun_name}")
 
 async def configure_model(llm_client: AsyncClient) -> str | None:
     """Fetch available models from the Ollama client and let the user select one.
@@ -188,15 +342,37 @@ async def configure_model(llm_client: AsyncClient) -> str | None:
 
 async def get_mcp_tools(mcp_client) ->Dict[str, dict]:
     tools_res: ListToolsResult = await mcp_client.list_tools_mcp()
-    raw_tools = tools_res.model_dump(mode="json")["tools"]
 
     # Convert each MCP tool description to the Ollama schema.
-    ollama_tools = [mcp_tool_to_schema(t) for t in raw_tools]
-    mcp_tool_map: Dict[str, dict] = {t["function"]["name"]: t for t in ollama_tools}
+    mcp_tool_map: Dict[str, dict] = {
+        t.name: mcp_tool_to_schema(t) for t in tools_res.tools
+    }
     return mcp_tool_map
 
-def get_native_tools() ->Dict[str, Callable]:
-    return {"hello_tool": hello_tool}
+def mcp_http_client_factory(
+        headers: Dict[str, str] | None = None,
+        timeout: httpx.Timeout | None = None,
+        auth: httpx.Auth | None = None,
+        follow_redirects: bool = True,
+        **kwargs: Any,
+) -> httpx.AsyncClient:
+    """Create the httpx client of the MCP session with a keep-alive pool.
+
+    Same as mcp's default factory, plus ``MCP_POOL_LIMITS``. The client lives
+    for the whole ``MpcClient`` session, so connections are reused across calls.
+    Other arguments the transport passes go straight to ``httpx.AsyncClient``.
+    """
+    return httpx.AsyncClient(
+        headers=headers,
+        timeout=timeout if timeout is not None else MCP_TIMEOUT,
+        auth=auth,
+        follow_redirects=follow_redirects,
+        limits=MCP_POOL_LIMITS,
+        **kwargs,
+    )
+
+def get_native_tools() ->Mapping[str, Callable]:
+    return NATIVE_TOOLS
 
 async def consume_command_config_model(agent_context: AgentContext, cmd_parts: List[str]) -> bool:
     if len(cmd_parts) == 1 or cmd_parts[1].strip().lower() == 'model':
@@ -215,9 +391,6 @@ def consume_command_config_streaming(
         value: str,
         len_parts: int
 ) -> bool:
-    if not sub_cmd == "streaming":
-        return False
-    
     error = False
     if value in ("on", "off"):
         agent_context.llm_config.isStreaming = (value == "on")
@@ -229,7 +402,7 @@ def consume_command_config_streaming(
         print("Usage: /config streaming [on|off]")
     else:
         new_value = 'on' if agent_context.llm_config.isStreaming else 'off'
-    print(f"Streaming set to {new_value}")
+        print(f"Streaming set to {new_value}")
     return True
     
 
@@ -239,9 +412,6 @@ def consume_command_config_thinking(
         value: str,
         len_parts: int
 ) -> bool:
-    if not sub_cmd == "thinking":
-        False
-
     error = False
     if not agent_context.allowed_config['thinking']:
         print(f"{agent_context.llm_config.model} does not have thinking capabilities")
@@ -260,9 +430,13 @@ def consume_command_config_thinking(
         print(f"Thinking set to {new_value}")
     return True
 
+# /config sub-command handlers keyed by the sub-command name
+CONFIG_HANDLERS: Dict[str, Callable[[AgentContext, str, str, int], bool]] = {
+    "streaming": consume_command_config_streaming,
+    "thinking": consume_command_config_thinking,
+}
+
 async def consume_command_config(agent_context: AgentContext, cmd: str) -> bool:
-    if not cmd.startswith("/config"):
-        return False
     parts = cmd.split()
 
     if await consume_command_config_model(agent_context, parts):
@@ -276,21 +450,33 @@ async def consume_command_config(agent_context: AgentContext, cmd: str) -> bool:
     else:
         value = ''
 
-    if consume_command_config_streaming(agent_context, sub_cmd, value, len_parts):
-        return True
-    elif consume_command_config_thinking(agent_context, sub_cmd, value, len_parts):
-        return True
+    handler = CONFIG_HANDLERS.get(sub_cmd)
+    if handler is not None:
+        return handler(agent_context, sub_cmd, value, len_parts)
     print("Unknown /config command. Available: /config [model], /config streaming [on|off], /config thinking [on|off]")
     return True
 
+async def consume_command_clear(agent_context: AgentContext, cmd: str) -> bool:
+    agent_context.messages = []
+    print("Context cleared:")
+    return True
+
+# REPL commands that end the session
+EXIT_COMMANDS = frozenset({"/bye", "/exit", "/quit"})
+
+# REPL command handlers keyed by the first token of the input
+COMMAND_HANDLERS: Dict[str, Callable[[AgentContext, str], Awaitable[bool]]] = {
+    "/config": consume_command_config,
+    "/clear": consume_command_clear,
+}
+
 async def consume_command(agent_context: AgentContext, cmd: str) -> bool:
-    if await consume_command_config(agent_context, cmd):
-        return True
-    if cmd == "/clear":
-        agent_context.messages = []
-        print("Context cleared:")
-        return True
-    return False
+    if not cmd.startswith("/"):
+        return False
+    handler = COMMAND_HANDLERS.get(cmd.split(maxsplit=1)[0])
+    if handler is None:
+        return False
+    return await handler(agent_context, cmd)
 
 async def llm_call(
         agent_context: AgentContext, interrupt_event: asyncio.Event):
@@ -300,99 +486,159 @@ async def llm_call(
     raises ``asyncio.CancelledError`` so that the caller can clean up.
     """
     print(f"Calling llm (streaming={agent_context.llm_config.isStreaming}):")
-    all_tools = agent_context.get_all_tools()
+    tools = agent_context.get_tools_values()
     
-    thinking: str = ""
-    content: str = ""
-    tool_calls: List[Dict[str, Any]] = []
-
+    # thinking is only displayed, it is not kept in the message history
+    thinking_started: bool = False
+    # collect chunks in a list and join once, avoiding quadratic str +=
+    content_parts: List[str] = []
+    content_started: bool = False
+    tool_calls: List[Any] = agent_context.tool_call_buffer
+    tool_calls.clear()
+
+    writer = StreamWriter()
     if agent_context.llm_config.isStreaming:
         stream: AsyncGenerator[ChatResponse, None] = await agent_context.llm_client.chat(
             model = agent_context.llm_config.model,
             messages = agent_context.messages,
             stream = agent_context.llm_config.isStreaming,
             think = agent_context.llm_config.isThinking,
-            tools = all_tools.values()
+            tools = tools
         )
 
-        async for chunk in stream:
-            if interrupt_event.is_set():
-                raise asyncio.CancelledError()
-            msg: Message = chunk.message
-            if msg.thinking:
-                if not thinking:
-                    print("Thinking:\n")
-                print(msg.thinking, end="", flush=True)
-                thinking += msg.thinking
-            elif msg.content:
-                if not content:
-                    print("\n\nAnswer:\n")
-                print(msg.content, end="", flush=True)
-                content += msg.content
-            elif msg.tool_calls:
-                print("\nTool_Call: ", end="")
-                print(msg.tool_calls)
-                tool_calls.extend(msg.tool_calls)
+        # bind the per-chunk lookups once, the loop runs at token rate
+        interrupted = interrupt_event.is_set
+        write = writer.write
+        add_content = content_parts.append
+        try:
+            async for chunk in stream:
+                if interrupted():
+                    raise asyncio.CancelledError()
+                msg: Message = chunk.message
+                if thinking_chunk := msg.thinking:
+                    if not thinking_started:
+                        write("Thinking:\n\n")
+                        thinking_started = True
+                    write(thinking_chunk)
+                elif content_chunk := msg.content:
+                    if not content_started:
+                        write("\n\nAnswer:\n\n")
+                        content_started = True
+                    write(content_chunk)
+                    add_content(content_chunk)
+                elif msg.tool_calls:
+                    if DEBUG:
+                        write(f"\nTool_Call: {msg.tool_calls}\n")
+                    tool_calls.extend(msg.tool_calls)
+        finally:
+            writer.flush()
+            # release the streaming response right away, also when interrupted,
+            # instead of leaving the open generator to the garbage collector
+            await stream.aclose()
     else:
         response: ChatResponse = await agent_context.llm_client.chat(
             model = agent_context.llm_config.model,
             messages = agent_context.messages,
             stream = agent_context.llm_config.isStreaming,
             think = agent_context.llm_config.isThinking,
-            tools = all_tools.values()
+            tools = tools
         )
         msg: Message = response.message
         if msg.thinking:
-            print("Thinking:\n")
-            print(msg.thinking, end="", flush=True)
-            thinking += msg.thinking
+            writer.write("Thinking:\n\n")
+            writer.write(msg.thinking)
         if msg.content:
-            print("\n\nAnswer:\n")
-            print(msg.content, end="", flush=True)
-            content += msg.content
+            writer.write("\n\nAnswer:\n\n")
+            writer.write(msg.content)
+            content_parts.append(msg.content)
         if msg.tool_calls:
-            print("\nTool_Call: ", end="")
-            print(msg.tool_calls)
+            if DEBUG:
+                writer.write(f"\nTool_Call: {msg.tool_calls}\n")
             tool_calls.extend(msg.tool_calls)
+        writer.flush()
 
     print("\n")
     return {
         'role': 'assistant',
-        'thinking': thinking,
-        'content': content,
-        'tool_calls': tool_calls
+        'content': "".join(content_parts),
+        # snapshot the reused buffer; plain answers share the empty tuple
+        'tool_calls': tuple(tool_calls)
     }
 
 async def llm_interaction(agent_context: AgentContext, interrupt_event: asyncio.Event) -> None:
-    """Run a single round of the chat, handling streaming responses.
+    """Run the chat until the model stops requesting tools.
 
     The function streams the model's reply, prints thinking/content to the
-    console, and processes any tool calls. After handling tool calls it recurses
+    console, and processes any tool calls. After handling tool calls it loops
     to continue the conversation. It respects ``interrupt_event`` so that a
     user‑initiated cancel (Ctrl‑C) aborts the current interaction and returns to
     the input loop.
+
+    At most ``MAX_TOOL_DEPTH`` rounds of tool calls are run. A call repeating
+    one that already failed is not sent again, and if every call of a round
+    is such a repeat the model is not called again either.
     """
-    all_tools = agent_context.get_all_tools()
+    # error results of failed calls, keyed by tool_call_key
+    failed_calls: Dict[Tuple[str, str], str] = {}
+    depth = 0
+    while True:
+        llm_response = await llm_call(agent_context, interrupt_event)
+        agent_context.messages.append(llm_response)
+
+        tool_calls = llm_response['tool_calls']
+        # If no tools were invoked the interaction is done
+        if not tool_calls:
+            break
 
-    llm_response = await llm_call(agent_context, interrupt_event)
-    agent_context.messages.append(llm_response)
+        depth += 1
+        if depth > MAX_TOOL_DEPTH:
+            note = f"Stopped after {MAX_TOOL_DEPTH} rounds of tool calls."
+            print(note)
+            agent_context.messages.append({"role": "assistant", "content": note})
+            break
 
-    # handle tool calling
-    for call in llm_response['tool_calls']:
+        # handle tool calling
         if interrupt_event.is_set():
-                raise asyncio.CancelledError()
-        result: str = ""
-        fun_name = call.function.name
-        fun_args = call.function.arguments or {}
-        result = await agent_context.call_tool(fun_name, fun_args)
-        print(result)
-        if result:
-            agent_context.messages.append(
-                {"role": "tool", "tool_name": fun_name, "content": result})
-
-    # If any tools were invoked we call llm again with tool result on context
-    if llm_response['tool_calls']:
-        await llm_interaction(agent_context, interrupt_event)
+            raise asyncio.CancelledError()
+        keys = [
+            tool_call_key(call.function.name, call.function.arguments or {})
+            for call in tool_calls
+        ]
+        # tool calls of a single turn are independent, so dispatch them
+        # concurrently; a failing tool must not discard the other results
+        pending = [
+            (call, key) for call, key in zip(tool_calls, keys)
+            if key not in failed_calls
+        ]
+        results: List[str | BaseException] = await asyncio.gather(*(
+            agent_context.call_tool(
+                call.function.name, call.function.arguments or {})
+            for call, _ in pending
+        ), return_exceptions=True)
+        if interrupt_event.is_set():
+            raise asyncio.CancelledError()
+        for (call, key), result in zip(pending, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                if isinstance(result, ToolCallError):
+                    failed_calls[key] = str(result)
+                else:
+                    failed_calls[key] = f"Tool call {call.function.name} failed: {result}"
+
+        results_by_key = {key: result for (_, key), result in zip(pending, results)}
+        for call, key in zip(tool_calls, keys):
+            fun_name = call.function.name
+            result = failed_calls.get(key) or results_by_key[key]
+            print(result)
+            if result:
+                agent_context.messages.append(
+                    {"role": "tool", "tool_name": fun_name, "content": result})
+
+        if not pending:
+            print("Tool calls repeat calls that already failed, stopping.")
+            break
+        # call llm again with tool result on context
 
 async def main() -> None:
     """Initialise clients, discover tools, and start the chat loop with signal handling."""
@@ -405,18 +651,23 @@ async def main() -> None:
         interrupt_event.set()
         print("\n[Interrupted] Cancelling current interaction...")
 
-    llm_client = AsyncClient(host=LLM_HOST)
-    async with MpcClient("http://localhost:8081/mcp") as mcp_client:
-        mcp_tools: Dict[str, dict] = await get_mcp_tools(mcp_client)
-        native_tools: Dict[str, Callable] = get_native_tools()
-        agent_context = AgentContext(
-            llm_client,
-            mcp_client,
-            mcp_tools=mcp_tools,
-            native_tools=native_tools
+    # extra kwargs are forwarded to the underlying httpx.AsyncClient
+    llm_client = AsyncClient(
+        host=LLM_HOST, timeout=LLM_TIMEOUT, limits=LLM_POOL_LIMITS)
+    mcp_transport = StreamableHttpTransport(
+        MCP_URL, httpx_client_factory=mcp_http_client_factory)
+    async with MpcClient(mcp_transport) as mcp_client:
+        agent_context = AgentContext(llm_client, mcp_client)
+
+        # Fetch the MCP tools while Ollama answers the capabilities query,
+        # which also warms up the llm connection before the first chat.
+        mcp_tools: Dict[str, dict]
+        mcp_tools, _ = await asyncio.gather(
+            get_mcp_tools(mcp_client),
+            agent_context.load_model_capabilities(),
         )
-
-        await agent_context.load_model_capabilities()
+        native_tools: Mapping[str, Callable] = get_native_tools()
+        agent_context.set_tools(mcp_tools, native_tools)
 
         loop = asyncio.get_running_loop()
         for sig in (signal.SIGINT, signal.SIGTERM):
@@ -426,7 +677,13 @@ async def main() -> None:
             interrupt_event.clear()
             print("You:")
             try:
-                user_input: str = read_multiline()
+                # read in a worker thread so the event loop keeps running
+                # (signal handlers, open connections) while the user types
+                user_input: str = await asyncio.to_thread(read_multiline)
+            except EOFError:
+                # stdin closed (Ctrl-D / end of piped input): same as /bye
+                print("Goodbye!")
+                break
             except KeyboardInterrupt:
                 # If user hits Ctrl-C while typing, just continue the loop
                 print("\n[Interrupted] Input cancelled. Returning to prompt.")
@@ -434,8 +691,11 @@ async def main() -> None:
             if interrupt_event.is_set():
                 continue
 
-            cmd: str = user_input.strip().lower()
-            if cmd == "/bye" or cmd == "/exit" or cmd == "/quit":
+            cmd: str = user_input.strip()
+            # only input that can be a command needs to be normalized
+            if cmd.startswith("/"):
+                cmd = cmd.lower()
+            if cmd in EXIT_COMMANDS:
                 print("Goodbye!")
                 break
             if await consume_command(agent_context, cmd):
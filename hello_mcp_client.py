@@ -5,15 +5,21 @@ from mcp.types import ListToolsResult
 
 client: MpcClient = MpcClient("http://localhost:8081/mcp")
 
+# The helpers expect the caller to hold the session open (`async with client:`)
+# so that every call reuses the same connection.
+
 async def list_tools() -> ListToolsResult :
-    
+    return await client.list_tools_mcp()
 
 async def call_tool(name: str):
+    call_result: CallToolResult = await client.call_tool("greet", {"name": name})
+    #help(call_result)
+    tools : ListToolsResult = await list_tools()
+    #print(tools)
+    #help(tools)
+
+async def main():
     async with client:
-        call_result: CallToolResult = await client.call_tool("greet", {"name": name})
-        #help(call_result)
-        tools : ListToolsResult = await client.list_tools_mcp()
-        #print(tools)
-        #help(tools)
-        
-asyncio.run(call_tool("Ford"))
+        await call_tool("Ford")
+
+asyncio.run(main())
@@ -1,22 +1,52 @@
-import requests
+import asyncio
+import time
+from typing import Any
+
+import httpx
 from fastmcp import FastMCP
 
-import json
 from sdr_leads_db import SDRDatabase
 mcp = FastMCP("DocExampleMcpSever")
 
+# Shared async client so weather lookups do not block the server event loop
+# and reuse their connection to wttr.in
+http_client = httpx.AsyncClient(timeout=5.0)
+# Seconds a weather answer for a city is reused before fetching it again
+WEATHER_TTL: float = 60.0
+# city (lowercase) -> (expires_at, answer)
+_weather_cache: dict[str, tuple[float, str]] = {}
+
+# Database shared by all tool calls, opened on first use. Read tools run their
+# query in a worker thread on one of DB_READERS pooled connections, so
+# concurrent calls neither block the event loop nor wait on each other.
+DB_READERS: int = 4
+_db: SDRDatabase | None = None
+
+def get_db() -> SDRDatabase:
+    """Return the shared SDRDatabase, opening it on the first call."""
+    global _db
+    if _db is None:
+        _db = SDRDatabase(readers=DB_READERS)
+    return _db
+
 @mcp.tool
 def greet(name: str) -> str:
     """greet(name) returns a greeting including name passed as parameter"""
     return f"Hello from MCP Server to {name}!"
 
 @mcp.tool
-def weather(city: str) -> str:
+async def weather(city: str) -> str:
     """Retrieve weather information for a given city and date using wttr.in.
     Note: wttr.in provides current weather; the date parameter is currently ignored.
     """
+    key = city.lower()
+    cached = _weather_cache.get(key)
+    now = time.monotonic()
+    if cached and cached[0] > now:
+        return cached[1]
     try:
-        response : Response = requests.get(f"https://wttr.in/{city}?format=j2")
+        response : httpx.Response = await http_client.get(
+            f"https://wttr.in/{city}?format=j2")
         response.raise_for_status()
         data = response.json()
         current_condition = data.get("current_condition", [{}])[0]
@@ -25,23 +55,37 @@ def weather(city: str) -> str:
             [ d.get('value', '')
               for d in current_condition.get('weatherDesc', {})])
 
-        return f"Weather in {city}: {desc}, {temp_c}°C"
+        answer = f"Weather in {city}: {desc}, {temp_c}°C"
+        # Drop expired answers on each write so the cache only ever holds
+        # the cities asked for within the last WEATHER_TTL seconds
+        for stale in [k for k, (expires_at, _) in _weather_cache.items()
+                      if expires_at <= now]:
+            del _weather_cache[stale]
+        _weather_cache[key] = (now + WEATHER_TTL, answer)
+        return answer
     except Exception as e:
         return f"Failed to retrieve weather: {e}"
 
 @mcp.tool
-def listLeads(status: str = "*") -> str:
-    """Return leads filtered by *status* (if provided) as a JSON string.
-    
+async def listLeads(status: str = "*") -> list[dict[str, Any]]:
+    """Return leads filtered by *status* (if provided).
+
     Parameters
     ----------
     status: str
         The lead status name to filter on, e.g. "Qualified". use "*" for all leads.
     """
-    db = SDRDatabase()
-    leads = db.list_leads(status=status) if status != "*" else db.list_leads()
-    db.close()
-    return json.dumps(leads, default=str)
+    db = get_db()
+    return await asyncio.to_thread(
+        db.list_leads, status=status if status != "*" else None)
+
+@mcp.tool
+async def rankManagersByBudget() -> list[dict[str, Any]]:
+    """Return managers ranked by the total budget of their leads.
+
+    Each entry has manager_id, name, email and total_budget, highest first.
+    """
+    return await asyncio.to_thread(get_db().rank_managers_by_budget)
 
 
 if __name__ == "__main__":
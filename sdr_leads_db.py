@@ -16,8 +16,10 @@ Features:
 
 from __future__ import annotations
 import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Iterable, List, Tuple, Optional, Dict, Any
+from queue import Queue
+from typing import Iterable, Iterator, List, Tuple, Optional, Dict, Any
 
 # ----------------------------------------------------------------------
 # Configuration
@@ -25,6 +27,20 @@ from typing import Iterable, List, Tuple, Optional, Dict, Any
 DB_FILENAME = "sdr_leads.db"                     # SQLite file placed in the current directory
 DB_PATH = Path.cwd() / DB_FILENAME
 
+# Connection tuning applied on open. WAL with synchronous=NORMAL skips the
+# fsync on every commit; a power loss can drop the latest commits but never
+# corrupts the database.
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",        # 256 MiB
+    "PRAGMA cache_size=-65536",          # 64 MiB
+)
+
+# Rows fetched per batch when iterating leads
+LEAD_FETCH_SIZE = 1000
+
 
 # ----------------------------------------------------------------------
 # Database schema
@@ -69,37 +85,174 @@ CREATE TABLE IF NOT EXISTS lead_manager (
     manager_id INTEGER NOT NULL REFERENCES manager(manager_id) ON DELETE CASCADE,
     PRIMARY KEY (lead_id, manager_id)
 );
+
+-- Indexes for the join/filter columns (the lead_manager primary key already
+-- covers lookups by lead_id)
+CREATE INDEX IF NOT EXISTS idx_lead_status ON lead(status_id);
+CREATE INDEX IF NOT EXISTS idx_lead_project ON lead(project_id);
+CREATE INDEX IF NOT EXISTS idx_lead_created ON lead(created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_leadmgr_manager ON lead_manager(manager_id);
 """
 
+# Stored in PRAGMA user_version once SCHEMA is applied, so warm starts skip
+# the script. Bump it (and migrate in _ensure_schema) when SCHEMA changes.
+SCHEMA_VERSION = 1
+
+# ----------------------------------------------------------------------
+# Statements
+# ----------------------------------------------------------------------
+# Hot statements are fixed strings so sqlite3's statement cache can reuse the
+# compiled statement instead of preparing it again on each call.
+INSERT_LEAD_SQL = """
+    INSERT INTO lead (target_name, contacts, observations, budget, project_id, status_id)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+# One multi-row INSERT per batch of (lead_id, manager_id) pairs; pairs already
+# present (or repeated in the batch) are dropped by the primary key. Batches
+# stay under SQLite's historical 999 bound-parameter limit.
+INSERT_LEAD_MANAGERS_SQL = """
+    INSERT INTO lead_manager (lead_id, manager_id)
+    VALUES {}
+    ON CONFLICT DO NOTHING
+"""
+SQLITE_MAX_VARIABLES = 999
+LEAD_MANAGER_BATCH = SQLITE_MAX_VARIABLES // 2
+
+# Managers are LEFT JOINed in the same query (one row per lead/manager pair)
+# instead of running one extra SELECT per lead.
+_LIST_LEADS_SELECT = """
+    SELECT l.lead_id, l.target_name, l.contacts, l.observations, l.budget,
+           p.name AS project_name, s.name AS status_name,
+           l.created_at, l.updated_at,
+           m.manager_id AS mgr_manager_id, m.name AS mgr_name,
+           m.email AS mgr_email
+    FROM lead l
+    JOIN project p ON l.project_id = p.project_id
+    JOIN status s ON l.status_id = s.status_id
+    LEFT JOIN lead_manager lm ON lm.lead_id = l.lead_id
+    LEFT JOIN manager m ON m.manager_id = lm.manager_id
+"""
+_LIST_LEADS_ORDER = " ORDER BY l.created_at DESC, l.lead_id, lm.manager_id"
+LIST_LEADS_SQL = _LIST_LEADS_SELECT + _LIST_LEADS_ORDER
+LIST_LEADS_BY_STATUS_SQL = _LIST_LEADS_SELECT + " WHERE s.name = ?" + _LIST_LEADS_ORDER
+
+# Total lead budget per assigned manager (leads without budget count as 0)
+RANK_MANAGERS_BY_BUDGET_SQL = """
+    SELECT m.manager_id, m.name, m.email,
+           COALESCE(SUM(l.budget), 0.0) AS total_budget
+    FROM manager m
+    JOIN lead_manager lm ON lm.manager_id = m.manager_id
+    JOIN lead l ON l.lead_id = lm.lead_id
+    GROUP BY m.manager_id
+    ORDER BY total_budget DESC, m.manager_id
+"""
+
+
+def _dict_rows(cur: sqlite3.Cursor) -> List[Dict[str, Any]]:
+    """Fetch the remaining rows of *cur* as dicts keyed by column name."""
+    cols = [d[0] for d in cur.description]
+    return [dict(zip(cols, row)) for row in cur.fetchall()]
+
 # ----------------------------------------------------------------------
 # Helper class
 # ----------------------------------------------------------------------
 class SDRDatabase:
     """Thin wrapper around SQLite for the SDR leads‑tracking tool."""
 
-    def __init__(self, db_path: Path = DB_PATH):
+    def __init__(self, db_path: Path = DB_PATH, fast_bulk: bool = False,
+                 readers: int = 0):
+        """Open (and create if needed) the database.
+
+        ``fast_bulk`` also turns off fsync entirely (synchronous=OFF). Only
+        use it for seeding / bulk loads of a database that can be rebuilt,
+        since a crash may then corrupt it.
+
+        ``readers`` opens that many extra connections for the read methods,
+        usable from any thread, so concurrent reads (e.g. MCP tool calls run
+        in worker threads) do not queue on one connection. WAL lets them read
+        while ``conn`` writes; they only see committed data. With the default
+        of 0 everything goes through ``conn``.
+        """
         self.db_path = db_path
-        self.conn = sqlite3.connect(self.db_path)
-        self.conn.row_factory = sqlite3.Row
+        self.conn = self._connect()
+        self._tx_depth = 0
+        if fast_bulk:
+            self.conn.execute("PRAGMA synchronous=OFF")
         self._ensure_schema()
-        self._seed_statuses()
+        self._readers: Optional[Queue[sqlite3.Connection]] = None
+        if readers > 0:
+            self._readers = Queue()
+            for _ in range(readers):
+                self._readers.put(self._connect(check_same_thread=False))
+        # status name -> status_id, so lead writes skip the lookup query
+        self._status_cache: Dict[str, int] = {
+            row["name"]: row["status_id"]
+            for row in self.conn.execute("SELECT status_id, name FROM status")
+        }
+
+    # --------------------------------------------------------------
+    # Transactions
+    # --------------------------------------------------------------
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Commit the enclosed writes together (rollback on error).
+
+        Nested blocks join the outermost one, so callers can group many
+        helper calls into a single commit.
+        """
+        outermost = self._tx_depth == 0
+        self._tx_depth += 1
+        try:
+            if outermost:
+                with self.conn:
+                    yield
+            else:
+                yield
+        finally:
+            self._tx_depth -= 1
 
     # --------------------------------------------------------------
     # Schema handling
     # --------------------------------------------------------------
+    def _connect(self, check_same_thread: bool = True) -> sqlite3.Connection:
+        """Open a connection to the database with the connection PRAGMAs."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=check_same_thread)
+        conn.row_factory = sqlite3.Row
+        for pragma in PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read connection from the pool (``conn`` if there is none)."""
+        if self._readers is None:
+            yield self.conn
+            return
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
     def _ensure_schema(self) -> None:
-        """Create tables if they do not exist."""
+        """Create tables and default statuses unless already at SCHEMA_VERSION."""
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
         with self.conn:
             self.conn.executescript(SCHEMA)
+            self.conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        self._seed_statuses()
 
     def _seed_statuses(self) -> None:
         """Insert default status values (idempotent)."""
         default_statuses = ["New", "Contacted", "Qualified", "Disqualified", "Won"]
-        with self.conn:
-            for name in default_statuses:
-                self.conn.execute(
-                    "INSERT OR IGNORE INTO status (name) VALUES (?)", (name,)
-                )
+        with self.transaction():
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO status (name) VALUES (?)",
+                [(name,) for name in default_statuses],
+            )
 
     # --------------------------------------------------------------
     # CRUD – Managers
@@ -112,14 +265,15 @@ class SDRDatabase:
         return cur.lastrowid
 
     def get_manager(self, manager_id: int) -> Optional[sqlite3.Row]:
-        cur = self.conn.execute(
-            "SELECT * FROM manager WHERE manager_id = ?", (manager_id,)
-        )
-        return cur.fetchone()
+        with self._reader() as conn:
+            cur = conn.execute(
+                "SELECT * FROM manager WHERE manager_id = ?", (manager_id,)
+            )
+            return cur.fetchone()
 
     def list_managers(self) -> List[sqlite3.Row]:
-        cur = self.conn.execute("SELECT * FROM manager ORDER BY name")
-        return cur.fetchall()
+        with self._reader() as conn:
+            return conn.execute("SELECT * FROM manager ORDER BY name").fetchall()
 
     # --------------------------------------------------------------
     # CRUD – Projects
@@ -132,30 +286,42 @@ class SDRDatabase:
         return cur.lastrowid
 
     def get_project(self, project_id: int) -> Optional[sqlite3.Row]:
-        cur = self.conn.execute(
-            "SELECT * FROM project WHERE project_id = ?", (project_id,)
-        )
-        return cur.fetchone()
+        with self._reader() as conn:
+            cur = conn.execute(
+                "SELECT * FROM project WHERE project_id = ?", (project_id,)
+            )
+            return cur.fetchone()
 
     def list_projects(self) -> List[sqlite3.Row]:
-        cur = self.conn.execute("SELECT * FROM project ORDER BY name")
-        return cur.fetchall()
+        with self._reader() as conn:
+            return conn.execute("SELECT * FROM project ORDER BY name").fetchall()
 
     # --------------------------------------------------------------
     # CRUD – Leads
     # --------------------------------------------------------------
     def _status_id(self, status_name: str) -> int:
         """Resolve (or insert) a status name to its id."""
+        try:
+            return self._status_cache[status_name]
+        except KeyError:
+            pass
+        # Not cached: another connection may have added it meanwhile
         cur = self.conn.execute(
             "SELECT status_id FROM status WHERE name = ?", (status_name,)
         )
         row = cur.fetchone()
         if row:
-            return row["status_id"]
-        cur = self.conn.execute(
-            "INSERT INTO status (name) VALUES (?)", (status_name,)
-        )
-        return cur.lastrowid
+            status_id = row["status_id"]
+        else:
+            cur = self.conn.execute(
+                "INSERT INTO status (name) VALUES (?)", (status_name,)
+            )
+            status_id = cur.lastrowid
+        # Cache only ids known to be committed: a row seen or inserted inside
+        # an open transaction disappears again if that transaction rolls back
+        if not self.conn.in_transaction:
+            self._status_cache[status_name] = status_id
+        return status_id
 
     def add_lead(
         self,
@@ -173,10 +339,7 @@ class SDRDatabase:
         """
         status_id = self._status_id(status)
         cur = self.conn.execute(
-            """
-            INSERT INTO lead (target_name, contacts, observations, budget, project_id, status_id)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
+            INSERT_LEAD_SQL,
             (target_name, contacts, observations, budget, project_id, status_id),
         )
         lead_id = cur.lastrowid
@@ -184,84 +347,160 @@ class SDRDatabase:
             self.assign_managers(lead_id, manager_ids)
         return lead_id
 
+    def add_leads(self, records: Iterable[Dict[str, Any]]) -> List[int]:
+        """
+        Insert many leads in one transaction and return their lead_ids in order.
+        Each record takes the keyword arguments of ``add_lead``.
+        """
+        records = list(records)
+        if not records:
+            return []
+        rows = [
+            (
+                r["target_name"],
+                r["contacts"],
+                r["observations"],
+                r.get("budget"),
+                r["project_id"],
+                self._status_id(r.get("status", "New")),
+            )
+            for r in records
+        ]
+        with self.transaction():
+            # The first insert takes the write lock, so the remaining rows get
+            # the following ids and can be read back in insertion order.
+            first_id = self.conn.execute(INSERT_LEAD_SQL, rows[0]).lastrowid
+            self.conn.executemany(INSERT_LEAD_SQL, rows[1:])
+            cur = self.conn.execute(
+                "SELECT lead_id FROM lead WHERE lead_id >= ? ORDER BY lead_id",
+                (first_id,),
+            )
+            lead_ids = [row["lead_id"] for row in cur.fetchall()]
+            pairs = [
+                (lead_id, m_id)
+                for lead_id, r in zip(lead_ids, records)
+                for m_id in r.get("manager_ids") or ()
+            ]
+            self._insert_lead_managers(pairs)
+        return lead_ids
+
     def assign_managers(self, lead_id: int, manager_ids: Iterable[int]) -> None:
         """Create (or replace) assignments of a lead to a set of managers."""
-        with self.conn:
-            for m_id in set(manager_ids):
-                self.conn.execute(
-                    """
-                    INSERT OR IGNORE INTO lead_manager (lead_id, manager_id)
-                    VALUES (?, ?)
-                    """,
-                    (lead_id, m_id),
-                )
+        pairs = [(lead_id, m_id) for m_id in manager_ids]
+        with self.transaction():
+            self._insert_lead_managers(pairs)
+
+    def _insert_lead_managers(self, pairs: List[Tuple[int, int]]) -> None:
+        """Insert (lead_id, manager_id) pairs, skipping existing ones."""
+        for start in range(0, len(pairs), LEAD_MANAGER_BATCH):
+            batch = pairs[start:start + LEAD_MANAGER_BATCH]
+            values = ", ".join(["(?, ?)"] * len(batch))
+            self.conn.execute(
+                INSERT_LEAD_MANAGERS_SQL.format(values),
+                [v for pair in batch for v in pair],
+            )
 
     def get_lead(self, lead_id: int) -> Optional[Dict[str, Any]]:
         """Fetch a lead together with related info (project, status, managers)."""
-        cur = self.conn.execute(
-            """
-            SELECT l.*, p.name AS project_name, s.name AS status_name
-            FROM lead l
-            JOIN project p ON l.project_id = p.project_id
-            JOIN status s ON l.status_id = s.status_id
-            WHERE l.lead_id = ?
-            """,
-            (lead_id,),
-        )
-        lead = cur.fetchone()
-        if not lead:
-            return None
-        mgr_cur = self.conn.execute(
-            """
-            SELECT m.manager_id, m.name, m.email
-            FROM manager m
-            JOIN lead_manager lm ON m.manager_id = lm.manager_id
-            WHERE lm.lead_id = ?
-            """,
-            (lead_id,),
-        )
-        managers = [dict(row) for row in mgr_cur.fetchall()]
-        result = dict(lead)
-        result["managers"] = managers
-        return result
-
-    def list_leads(self, *, status: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Return a list of leads, optionally filtered by status name, with assigned managers included.
-        Each lead dict will contain a "managers" key holding a list of manager dicts.
-        """
-        sql = """
-            SELECT l.lead_id, l.target_name, l.contacts, l.observations, l.budget,
-                   p.name AS project_name, s.name AS status_name,
-                   l.created_at, l.updated_at
-            FROM lead l
-            JOIN project p ON l.project_id = p.project_id
-            JOIN status s ON l.status_id = s.status_id
-        """
-        params: Tuple = ()
-        if status:
-            sql += " WHERE s.name = ?"
-            params = (status,)
-        sql += " ORDER BY l.created_at DESC"
-        cur = self.conn.execute(sql, params)
-        leads = [dict(row) for row in cur.fetchall()]
-        # Attach managers to each lead
-        for lead in leads:
-            mgr_cur = self.conn.execute(
+        with self._reader() as conn:
+            cur = conn.execute(
+                """
+                SELECT l.*, p.name AS project_name, s.name AS status_name
+                FROM lead l
+                JOIN project p ON l.project_id = p.project_id
+                JOIN status s ON l.status_id = s.status_id
+                WHERE l.lead_id = ?
+                """,
+                (lead_id,),
+            )
+            lead = cur.fetchone()
+            if not lead:
+                return None
+            mgr_cur = conn.execute(
                 """
                 SELECT m.manager_id, m.name, m.email
                 FROM manager m
                 JOIN lead_manager lm ON m.manager_id = lm.manager_id
                 WHERE lm.lead_id = ?
                 """,
-                (lead["lead_id"],),
+                (lead_id,),
             )
-            lead["managers"] = [dict(m) for m in mgr_cur.fetchall()]
-        return leads
+            managers = _dict_rows(mgr_cur)
+            result = dict(lead)
+            result["managers"] = managers
+            return result
+
+    def list_leads(self, *, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Return a list of leads, optionally filtered by status name, with assigned managers included.
+        Each lead dict will contain a "managers" key holding a list of manager dicts.
+        A manager assigned to several leads appears as the same dict object in
+        each of them, so treat the manager dicts as read-only.
+        """
+        return list(self.iter_leads(status=status))
+
+    def iter_leads(self, *, status: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Yield the leads of ``list_leads`` one at a time.
+
+        Rows are fetched in batches of ``LEAD_FETCH_SIZE``, so only the lead
+        being built is held in memory. Manager dicts are shared between the
+        leads of a call; treat them as read-only.
+        """
+        with self._reader() as conn:
+            # Plain tuples: the columns are unpacked by position below
+            cur = conn.cursor()
+            cur.row_factory = None
+            if status:
+                cur.execute(LIST_LEADS_BY_STATUS_SQL, (status,))
+            else:
+                cur.execute(LIST_LEADS_SQL)
+            # Rows of one lead are adjacent (ordered by lead), so a lead is
+            # complete once the next lead_id shows up
+            lead: Optional[Dict[str, Any]] = None
+            # One dict per manager, shared by all of that manager's leads
+            managers: Dict[int, Dict[str, Any]] = {}
+            while rows := cur.fetchmany(LEAD_FETCH_SIZE):
+                for (lead_id, target_name, contacts, observations, budget,
+                     project_name, status_name, created_at, updated_at,
+                     mgr_id, mgr_name, mgr_email) in rows:
+                    if lead is None or lead["lead_id"] != lead_id:
+                        if lead is not None:
+                            yield lead
+                        lead = {
+                            "lead_id": lead_id,
+                            "target_name": target_name,
+                            "contacts": contacts,
+                            "observations": observations,
+                            "budget": budget,
+                            "project_name": project_name,
+                            "status_name": status_name,
+                            "created_at": created_at,
+                            "updated_at": updated_at,
+                            "managers": [],
+                        }
+                    if mgr_id is not None:
+                        manager = managers.get(mgr_id)
+                        if manager is None:
+                            manager = managers[mgr_id] = {
+                                "manager_id": mgr_id,
+                                "name": mgr_name,
+                                "email": mgr_email,
+                            }
+                        lead["managers"].append(manager)
+            if lead is not None:
+                yield lead
+
+    # --------------------------------------------------------------
+    # Reports
+    # --------------------------------------------------------------
+    def rank_managers_by_budget(self) -> List[Dict[str, Any]]:
+        """Return managers with leads, ordered by the total budget of their leads."""
+        with self._reader() as conn:
+            return _dict_rows(conn.execute(RANK_MANAGERS_BY_BUDGET_SQL))
 
     def update_lead_status(self, lead_id: int, new_status: str) -> None:
         """Change the status of a lead."""
         status_id = self._status_id(new_status)
-        with self.conn:
+        with self.transaction():
             self.conn.execute(
                 "UPDATE lead SET status_id = ?, updated_at = CURRENT_TIMESTAMP WHERE lead_id = ?",
                 (status_id, lead_id),
@@ -269,13 +508,16 @@ class SDRDatabase:
 
     def delete_lead(self, lead_id: int) -> None:
         """Remove a lead (cascades to lead_manager)."""
-        with self.conn:
+        with self.transaction():
             self.conn.execute("DELETE FROM lead WHERE lead_id = ?", (lead_id,))
 
     # --------------------------------------------------------------
     # Utility
     # --------------------------------------------------------------
     def close(self) -> None:
+        if self._readers is not None:
+            while not self._readers.empty():
+                self._readers.get().close()
         self.conn.close()
 
 
@@ -284,79 +526,81 @@ class SDRDatabase:
 # ----------------------------------------------------------------------
 if __name__ == "__main__":
     db = SDRDatabase()
-    # 1️⃣ Add managers (multiple)
-    alice_id = db.add_manager("Alice Johnson", "alice@example.com")
-    bob_id   = db.add_manager("Bob Smith", "bob@example.com")
-    carol_id = db.add_manager("Carol Lee", "carol@example.com")
-    dave_id  = db.add_manager("Dave Patel", "dave@example.com")
+    # All seed writes share one transaction (a single commit)
+    with db.transaction():
+        # 1️⃣ Add managers (multiple)
+        alice_id = db.add_manager("Alice Johnson", "alice@example.com")
+        bob_id   = db.add_manager("Bob Smith", "bob@example.com")
+        carol_id = db.add_manager("Carol Lee", "carol@example.com")
+        dave_id  = db.add_manager("Dave Patel", "dave@example.com")
     
-    # 2️⃣ Create several projects
-    proj_a_id = db.add_project(
-        name="Enterprise CRM Rollout",
-        description="Implement a new CRM system for enterprise sales."
-    )
-    proj_b_id = db.add_project(
-        name="SMB Outreach Campaign",
-        description="Target small‑business customers with a new product line."
-    )
-    proj_c_id = db.add_project(
-        name="International Expansion",
-        description="Explore leads in the APAC region."
-    )
+        # 2️⃣ Create several projects
+        proj_a_id = db.add_project(
+            name="Enterprise CRM Rollout",
+            description="Implement a new CRM system for enterprise sales."
+        )
+        proj_b_id = db.add_project(
+            name="SMB Outreach Campaign",
+            description="Target small‑business customers with a new product line."
+        )
+        proj_c_id = db.add_project(
+            name="International Expansion",
+            description="Explore leads in the APAC region."
+        )
     
-    # 3️⃣ Insert a variety of leads covering different use‑cases
-    # Lead 1 – New lead, budget, multiple managers
-    lead1_id = db.add_lead(
-        target_name="Acme Corp",
-        contacts="john.doe@acme.com, +1‑555‑123‑4567",
-        observations="Interested in API integration; budget $50k.",
-        project_id=proj_a_id,
-        status="New",
-        manager_ids=[alice_id, bob_id],
-        budget=50000.0,
-    )
+        # 3️⃣ Insert a variety of leads covering different use‑cases
+        # Lead 1 – New lead, budget, multiple managers
+        lead1_id = db.add_lead(
+            target_name="Acme Corp",
+            contacts="john.doe@acme.com, +1‑555‑123‑4567",
+            observations="Interested in API integration; budget $50k.",
+            project_id=proj_a_id,
+            status="New",
+            manager_ids=[alice_id, bob_id],
+            budget=50000.0,
+        )
     
-    # Lead 2 – Contacted, no budget, single manager
-    lead2_id = db.add_lead(
-        target_name="Beta LLC",
-        contacts="susan@beta.com, +1‑555‑987‑6543",
-        observations="Demo scheduled for next week.",
-        project_id=proj_b_id,
-        status="Contacted",
-        manager_ids=[carol_id],
-    )
+        # Lead 2 – Contacted, no budget, single manager
+        lead2_id = db.add_lead(
+            target_name="Beta LLC",
+            contacts="susan@beta.com, +1‑555‑987‑6543",
+            observations="Demo scheduled for next week.",
+            project_id=proj_b_id,
+            status="Contacted",
+            manager_ids=[carol_id],
+        )
     
-    # Lead 3 – Qualified, larger budget, multiple managers
-    lead3_id = db.add_lead(
-        target_name="Gamma Industries",
-        contacts="info@gamma.io",
-        observations="Potential $200k deal.",
-        project_id=proj_c_id,
-        status="Qualified",
-        manager_ids=[alice_id, dave_id],
-        budget=200000.0,
-    )
+        # Lead 3 – Qualified, larger budget, multiple managers
+        lead3_id = db.add_lead(
+            target_name="Gamma Industries",
+            contacts="info@gamma.io",
+            observations="Potential $200k deal.",
+            project_id=proj_c_id,
+            status="Qualified",
+            manager_ids=[alice_id, dave_id],
+            budget=200000.0,
+        )
     
-    # Lead 4 – Disqualified, no manager assignment
-    lead4_id = db.add_lead(
-        target_name="Delta Startup",
-        contacts="founder@delta.io",
-        observations="No budget, decided to look elsewhere.",
-        project_id=proj_b_id,
-        status="Disqualified",
-        manager_ids=None,
-    )
+        # Lead 4 – Disqualified, no manager assignment
+        lead4_id = db.add_lead(
+            target_name="Delta Startup",
+            contacts="founder@delta.io",
+            observations="No budget, decided to look elsewhere.",
+            project_id=proj_b_id,
+            status="Disqualified",
+            manager_ids=None,
+        )
     
-    # Lead 5 – Won, single manager, budget
-    lead5_id = db.add_lead(
-        target_name="Epsilon Enterprises",
-        contacts="contact@epsilon.com",
-        observations="Closed deal, implementation in Q3.",
-        project_id=proj_a_id,
-        status="Won",
-        manager_ids=[bob_id],
-        budget=75000.0,
-    )
+        # Lead 5 – Won, single manager, budget
+        lead5_id = db.add_lead(
+            target_name="Epsilon Enterprises",
+            contacts="contact@epsilon.com",
+            observations="Closed deal, implementation in Q3.",
+            project_id=proj_a_id,
+            status="Won",
+            manager_ids=[bob_id],
+            budget=75000.0,
+        )
     
     # 4️⃣ Retrieve and pretty‑print one lead as a sanity check
     lead = db.get_lead(lead1_id)
@@ -1,88 +1,61 @@
 import asyncio
-import json
+from operator import itemgetter
 
 from fastmcp import Client as MpcClient
 from fastmcp.client.client import CallToolResult
 from mcp.types import ListToolsResult
 
+try:
+    import matplotlib.pyplot as plt
+except ImportError:
+    plt = None
+
 client: MpcClient = MpcClient("http://localhost:8081/mcp")
 
 
-async def call_list_leads(status: str):
-    async with client:
-        call_result: CallToolResult = await client.call_tool("listLeads", {"status": status})
-        if (call_result.is_error):
-            return None
-        result_json_str = call_result.structured_content['result']
-        # Parse the JSON string into Python objects
-        try:
-            leads = json.loads(result_json_str)
-        except json.JSONDecodeError as e:
-            print(f"Failed to parse JSON: {e}")
-            leads = []
-        # Return the parsed leads for further processing
-        return leads
+# The helpers take the session opened by ``async with client`` so that one
+# connection serves every call made from main().
+
+async def _rank_managers_by_budget(session: MpcClient):
+    """Fetch the manager ranking computed by the server (SQL aggregation)."""
+    call_result: CallToolResult = await session.call_tool("rankManagersByBudget", {})
+    return rank_managers_by_budget(call_result)
 
-asyncio.run(call_list_leads("*"))
 
+def rank_managers_by_budget(call_result: CallToolResult):
+    """Parse the ranking returned by the rankManagersByBudget tool.
 
-def rank_managers_by_budget(leads):
-    """Aggregate budgets per manager and return ranking.
+    The server sums the budgets per manager in SQL and returns them as
+    structured content, so this only unwraps its answer.
 
     Args:
-        leads (list): List of lead dictionaries as returned by the MCP tool.
+        call_result (CallToolResult): Result of the rankManagersByBudget call.
     Returns:
-        list: Sorted list of managers with total_budget in descending order.
+        list: Managers with total_budget in descending order (None if the
+        tool call failed).
     """
-    manager_budget = {}
-    for lead in leads:
-        budget = lead.get('budget')
-        if budget is None:
-            budget = 0
-        for mgr in lead.get('managers', []):
-            mgr_id = mgr.get('manager_id')
-            if mgr_id is None:
-                continue
-            # Initialise manager entry if not present
-            if mgr_id not in manager_budget:
-                manager_budget[mgr_id] = {
-                    'manager_id': mgr_id,
-                    'name': mgr.get('name'),
-                    'email': mgr.get('email'),
-                    'total_budget': 0.0,
-                }
-            manager_budget[mgr_id]['total_budget'] += budget
-    # Convert to list and sort by total_budget descending
-    ranked = sorted(manager_budget.values(), key=lambda x: x['total_budget'], reverse=True)
-    return ranked
+    if (call_result.is_error):
+        return None
+    # The tool returns the ranking as structured content, already decoded
+    return call_result.structured_content['result']
 
 async def main():
-    leads = await call_list_leads("*")
-    if not leads:
-        print("No leads retrieved.")
-        return
+    async with client as session:
+        ranking = await _rank_managers_by_budget(session)
+        if not ranking:
+            print("No leads retrieved.")
+            return
     
-    ranking = rank_managers_by_budget(leads)
-    print(ranking)
-    print("Manager ranking by total budget managed:")
-    for idx, mgr in enumerate(ranking, start=1):
-        print(f"{idx}. {mgr['name']} ({mgr['email']}): $ {mgr['total_budget']:.2f}")
-        
-    try:
-        import matplotlib.pyplot as plt
-    except ImportError:
+        print(ranking)
+        print("Manager ranking by total budget managed:")
+        for idx, mgr in enumerate(ranking, start=1):
+            print(f"{idx}. {mgr['name']} ({mgr['email']}): $ {mgr['total_budget']:.2f}")
+
+    if plt is None:
         print("matplotlib not available")
     else:
-        
-        
-        leads = await call_list_leads("*")
-        if not leads:
-            print("No leads retrieved.")
-            return
-        ranking = rank_managers_by_budget(leads)
-        # Prepare data for plotting
-        names = [m['name'] for m in ranking]
-        budgets = [m['total_budget'] for m in ranking]
+        # Prepare data for plotting (one pass over the ranking)
+        names, budgets = zip(*map(itemgetter('name', 'total_budget'), ranking))
         # Plot bar chart
         plt.figure(figsize=(10, 6))
         bars = plt.bar(names, budgets, color='steelblue')